@@ -23,8 +23,9 @@
 import json
 import os
 from clinica import Clinica
-from validaciones import solicitar_cadena, solicitar_entero, solicitar_obra_social
+from validaciones import solicitar_entero, solicitar_validado, PIPELINE_PACIENTE, PIPELINE_TURNO
 from turno import Turno
+from exportar import exportar_csv, exportar_columnar
 
 def generar_configs_json():
     """
@@ -59,6 +60,9 @@ def cargar_configs():
         configs = json.load(f)
     return configs
 
+# Opción del menú que termina el programa (la usan también los guiones de simulacion.py)
+OPCION_SALIR = 11
+
 # Función principal de la aplicación
 def main_app():
     generar_configs_json()
@@ -76,21 +80,26 @@ def main_app():
         print("6. Cobrar atenciones")
         print("7. Cerrar caja")
         print("8. Mostrar informe")
-        print("9. Salir")
+        print("9. Historial de paciente")
+        print("10. Exportar datos")
+        print(f"{OPCION_SALIR}. Salir")
 
-        opcion = solicitar_entero("Seleccione una opción: ", 1, 9)
+        opcion = solicitar_entero("Seleccione una opción: ", 1, OPCION_SALIR)
+        if opcion == OPCION_SALIR:
+            print("Saliendo del programa...")
+            break
 
         match opcion:
             case 1:
-                nombre = solicitar_cadena("Ingrese nombre del paciente: ", 30)
-                apellido = solicitar_cadena("Ingrese apellido del paciente: ", 30)
-                dni = solicitar_entero("Ingrese DNI del paciente: ")
-                edad = solicitar_entero("Ingrese edad del paciente: ", 18, 90)
-                obra_social = solicitar_obra_social(edad)
+                nombre = solicitar_validado("Ingrese nombre del paciente: ", 'nombre', PIPELINE_PACIENTE)
+                apellido = solicitar_validado("Ingrese apellido del paciente: ", 'apellido', PIPELINE_PACIENTE)
+                dni = solicitar_validado("Ingrese DNI del paciente: ", 'dni', PIPELINE_PACIENTE, conversor=int, dnis_registrados=clinica.dnis_registrados)
+                edad = solicitar_validado("Ingrese edad del paciente: ", 'edad', PIPELINE_PACIENTE, conversor=int)
+                obra_social = solicitar_validado("Ingrese obra social (Swiss Medical, Apres, PAMI, Particular): ", 'obra_social', PIPELINE_PACIENTE, registro={'edad': edad})
                 clinica.cargar_paciente(nombre, apellido, dni, edad, obra_social)  
             case 2:
                 id_paciente = solicitar_entero("Ingrese ID del paciente: ")
-                especialidad = input("Ingrese especialidad (Medico Clinico, Odontologia, Psicologia, Traumatologia): ")
+                especialidad = solicitar_validado(f"Ingrese especialidad ({', '.join(clinica.especialidades)}): ", 'especialidad', PIPELINE_TURNO, registro={'especialidades': clinica.especialidades})
                 #monto = 4000
                 #turno = Turno(id_paciente, especialidad, monto)
                 clinica.cargar_turno(id_paciente, especialidad)
@@ -110,8 +119,14 @@ def main_app():
             case 8:
                 clinica.mostrar_informe()
             case 9:
-                print("Saliendo del programa...")
-                break
+                id_paciente = solicitar_entero("Ingrese ID del paciente: ")
+                clinica.mostrar_historial_paciente(id_paciente)
+            case 10:
+                print("1. Exportar a CSV")
+                print("2. Exportar a formato columnar")
+                formato = solicitar_entero("Seleccione un formato: ", 1, 2)
+                resultado = exportar_csv(clinica) if formato == 1 else exportar_columnar(clinica)
+                print(f"{resultado['registros']} registros exportados a {resultado['ruta']} ({resultado['registros_por_segundo']:.0f} registros/seg).")
     #clinica.actualizar_archivos()
 
 if __name__ == "__main__":
@@ -22,7 +22,7 @@
 import json
 from paciente import Paciente
 from turno import Turno
-from validaciones import validar_nombre_apellido, validar_edad, validar_obra_social, validar_especialidad
+from validaciones import PIPELINE_PACIENTE, PIPELINE_TURNO, MENSAJES_ERROR
 from datetime import date, datetime
 
 
@@ -37,7 +37,9 @@ class Clinica:
         """
         self.razon_social = razon_social
         self.lista_pacientes = []
+        self.dnis_registrados = set() # DNIs de los pacientes cargados, para controlar duplicados
         self.lista_turnos = []
+        self.turnos_por_paciente = {} # indice id_paciente -> lista de sus turnos
         self.especialidades = especialidades
         self.obras_sociales_validas = obras_sociales
         self.recaudacion = 0
@@ -63,6 +65,7 @@ class Clinica:
                             paciente_data.get('obra_social', '')
                         )
                         self.lista_pacientes.append(paciente)
+                        self.dnis_registrados.add(paciente.dni)
                 self.next_patient_id = max([p.id for p in self.lista_pacientes], default=0) + 1
         except FileNotFoundError:
             pass
@@ -80,6 +83,7 @@ class Clinica:
                             turno_data.get('estado', 'Activo')
                         )
                         self.lista_turnos.append(turno)
+                        self._indexar_turno(turno)
         except FileNotFoundError:
             pass
 
@@ -132,24 +136,43 @@ class Clinica:
         :param dni: DNI del paciente
         :param edad: Edad del paciente
         :param obra_social: Obra social del paciente
+        :return: Lista con los códigos de error (vacía si el paciente fue registrado)
         """
-        if not validar_nombre_apellido(nombre) or not validar_nombre_apellido(apellido):
-            print("Error: Nombre o apellido inválido.")
-            return
-        if not validar_edad(edad):
-            print("Error: Edad inválida.")
-            return
-        if not validar_obra_social(obra_social, edad):
-            print("Error: Obra social inválida.")
-            return
-        for paciente in self.lista_pacientes:
-            if paciente.dni == dni:
-                print("Error: Ya existe un paciente con ese DNI.")
-                return
-        nuevo_paciente = Paciente(self.next_patient_id, nombre, apellido, dni, edad, date.today(), obra_social)
+        registro = {'nombre': nombre, 'apellido': apellido, 'dni': dni, 'edad': edad, 'obra_social': obra_social}
+        errores = PIPELINE_PACIENTE.validar(registro, self.dnis_registrados)
+        for codigo in errores:
+            print(f"Error: {MENSAJES_ERROR[codigo]}")
+        if errores:
+            return errores
+        self._agregar_paciente(registro)
+        print(f"Paciente {nombre} {apellido} registrado con éxito.")
+        return errores
+
+    def cargar_pacientes_lote(self, registros):
+        """
+        La función `cargar_pacientes_lote` valida una lista de pacientes en una sola pasada y registra
+        los que son válidos. No se detiene en el primer error: informa todos los errores de cada registro.
+
+        :param registros: Lista de diccionarios con nombre, apellido, dni, edad y obra_social
+        :return: Diccionario índice del registro -> lista de códigos de error, solo para los registros rechazados
+        """
+        errores_por_registro = PIPELINE_PACIENTE.validar_lote(registros, self.dnis_registrados)
+        for indice, registro in enumerate(registros):
+            if indice not in errores_por_registro:
+                self._agregar_paciente(registro)
+        return errores_por_registro
+
+    def _agregar_paciente(self, registro):
+        """
+        La función `_agregar_paciente` crea el paciente a partir de un registro ya validado y lo agrega a la clínica.
+
+        :param registro: Diccionario con nombre, apellido, dni, edad y obra_social
+        """
+        nuevo_paciente = Paciente(self.next_patient_id, registro['nombre'], registro['apellido'], registro['dni'],
+                                  registro['edad'], date.today(), registro['obra_social'])
         self.lista_pacientes.append(nuevo_paciente)
+        self.dnis_registrados.add(nuevo_paciente.dni)
         self.next_patient_id += 1
-        print(f"Paciente {nombre} {apellido} registrado con éxito.")
 
     def cargar_turno(self, id_paciente, especialidad):
         """
@@ -158,6 +181,11 @@ class Clinica:
         :param id_paciente: ID del paciente para el que se registra el turno
         :param especialidad: Especialidad para la cual se solicita el turno
         """
+        errores = PIPELINE_TURNO.validar({'especialidad': especialidad, 'especialidades': self.especialidades})
+        for codigo in errores:
+            print(f"Error: {MENSAJES_ERROR[codigo]}")
+        if errores:
+            return
         # Buscar el paciente en la lista por su id
         paciente = None
         for p in self.lista_pacientes:
@@ -168,6 +196,10 @@ class Clinica:
         if paciente is None:
             print("Error: Paciente no encontrado.")
             return
+        # No permito reservar si el paciente ya tiene un turno en espera
+        if self.tiene_turno_activo(id_paciente):
+            print("Error: El paciente ya tiene un turno activo.")
+            return
         # Calcular monto con la función calcular_monto_a_pagar
         monto_a_pagar = self.calcular_monto_a_pagar(id_paciente, especialidad)
         if monto_a_pagar is None:
@@ -176,8 +208,78 @@ class Clinica:
         # Si no problem, crear un nuevo Turno con sus datos
         nuevo_turno = Turno(id_paciente, especialidad, monto_a_pagar, fecha=date.today())
         self.lista_turnos.append(nuevo_turno)  # Lo agrego a la lista de la clínica
+        self._indexar_turno(nuevo_turno)
         print(f"Turno para {especialidad} registrado con éxito.")
 
+    def _indexar_turno(self, turno):
+        """
+        La función `_indexar_turno` agrega el turno al índice `turnos_por_paciente`, de modo que los
+        turnos de un paciente se obtengan sin recorrer `lista_turnos` completa.
+
+        :param turno: Turno a indexar
+        """
+        self.turnos_por_paciente.setdefault(turno.id_paciente, []).append(turno)
+
+    def historial_paciente(self, id_paciente):
+        """
+        La función `historial_paciente` devuelve los turnos del paciente en el orden en que fueron cargados.
+
+        :param id_paciente: ID del paciente
+        :return: Lista de turnos del paciente (vacía si no tiene turnos)
+        """
+        return list(self.turnos_por_paciente.get(id_paciente, []))
+
+    def saldo_pendiente(self, id_paciente):
+        """
+        La función `saldo_pendiente` suma los montos de los turnos del paciente ya atendidos ('Finalizado')
+        que todavía no fueron cobrados, igual que los que cobra `cobrar_atenciones`. Los turnos 'Activo'
+        no cuentan, porque todavía no hubo atención.
+
+        :param id_paciente: ID del paciente
+        :return: Monto adeudado por el paciente
+        """
+        return sum(t.monto for t in self.turnos_por_paciente.get(id_paciente, []) if t.estado == 'Finalizado')
+
+    def ultima_visita(self, id_paciente):
+        """
+        La función `ultima_visita` devuelve la fecha del último turno atendido (Finalizado o Pagado) del paciente.
+
+        :param id_paciente: ID del paciente
+        :return: Fecha de la última visita, o None si el paciente nunca fue atendido
+        """
+        fechas = [t.fecha for t in self.turnos_por_paciente.get(id_paciente, []) if t.estado in ('Finalizado', 'Pagado')]
+        return max(fechas, default=None)
+
+    def tiene_turno_activo(self, id_paciente):
+        """
+        La función `tiene_turno_activo` indica si el paciente tiene un turno en espera (estado 'Activo').
+
+        :param id_paciente: ID del paciente
+        :return: True si el paciente tiene un turno activo, False en caso contrario
+        """
+        return any(t.estado == 'Activo' for t in self.turnos_por_paciente.get(id_paciente, []))
+
+    def mostrar_historial_paciente(self, id_paciente):
+        """
+        La función `mostrar_historial_paciente` muestra los turnos del paciente, su saldo pendiente y su última visita.
+
+        :param id_paciente: ID del paciente
+        """
+        if not any(p.id == id_paciente for p in self.lista_pacientes):
+            print("Error: Paciente no encontrado.")
+            return
+        historial = self.historial_paciente(id_paciente)
+        if not historial:
+            print("El paciente no tiene turnos registrados.")
+            return
+        for turno in historial:
+            print(f"Fecha: {turno.fecha.strftime('%Y-%m-%d')}, Especialidad: {turno.especialidad}, Monto: ${turno.monto:.2f}, Estado: {turno.estado}")
+        ultima = self.ultima_visita(id_paciente)
+        print(f"Saldo pendiente: ${self.saldo_pendiente(id_paciente):.2f}")
+        print(f"Última visita: {ultima.strftime('%Y-%m-%d') if ultima else 'Sin visitas'}")
+        if self.tiene_turno_activo(id_paciente):
+            print("El paciente tiene un turno activo.")
+
     def calcular_monto_a_pagar(self, id_paciente, especialidad):
         """
         La función `calcular_monto_a_pagar` calcula el monto a pagar por un turno basado en la especialidad,
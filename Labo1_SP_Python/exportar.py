@@ -0,0 +1,313 @@
+# MIT License
+#
+# Copyright (c) 2024 [UTN FRA](https://fra.utn.edu.ar/) All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import argparse
+import csv
+import io
+import json
+import math
+import os
+import struct
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# Columnas exportadas por cada turno (ya unido con los datos de su paciente) y su tipo
+ESQUEMA = [
+    ('id_paciente', 'int'),
+    ('nombre', 'str'),
+    ('apellido', 'str'),
+    ('dni', 'int'),
+    ('obra_social', 'str'),
+    ('especialidad', 'str'),
+    ('monto', 'float'),
+    ('fecha', 'str'),
+    ('estado', 'str')
+]
+
+MAGIC_COLUMNAR = b'UTNC'
+TAMANIO_LOTE = 1000
+
+
+def filas_exportacion(clinica):
+    """
+    Genera una fila por turno con los datos del paciente ya unidos, en el orden de `ESQUEMA`.
+    Los pacientes se indexan por ID una sola vez, así la unión no recorre la lista por cada turno.
+
+    :param clinica: Instancia de Clinica con los datos cargados.
+    :return: Generador de tuplas.
+    """
+    pacientes = {p.id: p for p in clinica.lista_pacientes}
+    for turno in clinica.lista_turnos:
+        paciente = pacientes.get(turno.id_paciente)
+        yield (
+            turno.id_paciente,
+            paciente.nombre if paciente else '',
+            paciente.apellido if paciente else '',
+            int(paciente.dni or 0) if paciente else 0,
+            paciente.obra_social if paciente else '',
+            turno.especialidad,
+            float(turno.monto),
+            turno.fecha.strftime('%Y-%m-%d'),
+            turno.estado
+        )
+
+
+def _codificar_csv(filas):
+    """
+    Codifica un lote de filas como texto CSV (sin encabezado).
+
+    :param filas: Lista de tuplas en el orden de `ESQUEMA`.
+    :return: Bytes UTF-8 del lote.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerows(filas)
+    return buffer.getvalue().encode('utf-8')
+
+
+def _arreglo_bytes(arreglo):
+    """
+    Devuelve los bytes de un array en little-endian, sin importar la plataforma.
+    """
+    if sys.byteorder == 'big':
+        arreglo.byteswap()
+    return arreglo.tobytes()
+
+
+def _codificar_columnar(filas):
+    """
+    Codifica un lote de filas como un grupo columnar: cantidad de filas y, por cada columna,
+    su largo en bytes seguido de los valores. Los enteros van como int64, los montos como
+    float64 y las cadenas como offsets uint32 más el texto UTF-8 concatenado.
+
+    :param filas: Lista de tuplas en el orden de `ESQUEMA`.
+    :return: Bytes del grupo.
+    """
+    partes = [struct.pack('<I', len(filas))]
+    for indice, (_, tipo) in enumerate(ESQUEMA):
+        valores = [fila[indice] for fila in filas]
+        if tipo == 'int':
+            datos = _arreglo_bytes(array('q', valores))
+        elif tipo == 'float':
+            datos = _arreglo_bytes(array('d', valores))
+        else:
+            textos = [valor.encode('utf-8') for valor in valores]
+            offsets = array('I', [0])
+            for texto in textos:
+                offsets.append(offsets[-1] + len(texto))
+            datos = _arreglo_bytes(offsets) + b''.join(textos)
+        partes.append(struct.pack('<I', len(datos)))
+        partes.append(datos)
+    return b''.join(partes)
+
+
+def _lotes(filas, tamanio_lote):
+    """
+    Agrupa un iterable de filas en listas de a lo sumo `tamanio_lote` elementos.
+    """
+    iterador = iter(filas)
+    while True:
+        lote = list(islice(iterador, tamanio_lote))
+        if not lote:
+            return
+        yield lote
+
+
+def _exportar(filas, archivo, codificador, tamanio_lote, procesos):
+    """
+    Codifica las filas por lotes y las escribe en orden en `archivo`. Con más de un proceso, los
+    lotes se codifican en paralelo manteniendo como máximo dos lotes en vuelo por proceso, para
+    que la memoria usada no crezca con el tamaño de los datos.
+
+    :return: Cantidad de registros escritos.
+    """
+    registros = 0
+    if procesos == 1:
+        for lote in _lotes(filas, tamanio_lote):
+            archivo.write(codificador(lote))
+            registros += len(lote)
+        return registros
+
+    with ProcessPoolExecutor(max_workers=procesos) as executor:
+        en_vuelo = deque()
+        for lote in _lotes(filas, tamanio_lote):
+            en_vuelo.append(executor.submit(codificador, lote))
+            registros += len(lote)
+            if len(en_vuelo) >= procesos * 2:
+                archivo.write(en_vuelo.popleft().result())
+        while en_vuelo:
+            archivo.write(en_vuelo.popleft().result())
+    return registros
+
+
+def _procesos_a_usar(clinica, tamanio_lote, procesos):
+    """
+    Valida los parámetros de la exportación y devuelve cuántos procesos usar: nunca más que la
+    cantidad de lotes, así un volumen que entra en un solo lote se codifica sin levantar procesos.
+
+    :raises ValueError: Si `tamanio_lote` o `procesos` son menores que 1.
+    """
+    if not isinstance(tamanio_lote, int) or tamanio_lote < 1:
+        raise ValueError(f"El tamaño de lote debe ser un entero mayor o igual a 1 (se recibió {tamanio_lote!r}).")
+    if procesos is not None and (not isinstance(procesos, int) or procesos < 1):
+        raise ValueError(f"La cantidad de procesos debe ser un entero mayor o igual a 1 (se recibió {procesos!r}).")
+    cantidad_lotes = math.ceil(len(clinica.lista_turnos) / tamanio_lote)
+    return max(1, min(procesos or os.cpu_count() or 1, cantidad_lotes))
+
+
+def _estadisticas(ruta, registros, inicio):
+    """
+    Arma el resumen de una exportación con su throughput en registros por segundo.
+    """
+    segundos = time.perf_counter() - inicio
+    return {
+        'ruta': ruta,
+        'registros': registros,
+        'segundos': segundos,
+        'registros_por_segundo': registros / segundos if segundos > 0 else 0.0
+    }
+
+
+def exportar_csv(clinica, ruta='turnos_export.csv', tamanio_lote=TAMANIO_LOTE, procesos=None):
+    """
+    Exporta los turnos, unidos con sus pacientes, a un archivo CSV con encabezado.
+
+    :param clinica: Instancia de Clinica con los datos cargados.
+    :param ruta: Ruta del archivo a generar.
+    :param tamanio_lote: Cantidad de filas codificadas por lote.
+    :param procesos: Cantidad de procesos que codifican lotes (por defecto, la cantidad de CPUs,
+    limitada a la cantidad de lotes).
+    :return: Diccionario con registros, segundos y registros_por_segundo. El tiempo incluye el
+    arranque de los procesos, que domina en exportaciones chicas.
+    :raises ValueError: Si `tamanio_lote` o `procesos` son menores que 1.
+    """
+    procesos = _procesos_a_usar(clinica, tamanio_lote, procesos)
+    inicio = time.perf_counter()
+    with open(ruta, 'wb') as archivo:
+        archivo.write(_codificar_csv([[nombre for nombre, _ in ESQUEMA]]))
+        registros = _exportar(filas_exportacion(clinica), archivo, _codificar_csv, tamanio_lote, procesos)
+    return _estadisticas(ruta, registros, inicio)
+
+
+def exportar_columnar(clinica, ruta='turnos_export.utnc', tamanio_lote=TAMANIO_LOTE, procesos=None):
+    """
+    Exporta los turnos, unidos con sus pacientes, a un archivo columnar binario. El archivo empieza
+    con `MAGIC_COLUMNAR` y el esquema en JSON (precedido por su largo), seguido de un grupo
+    columnar por lote.
+
+    :param clinica: Instancia de Clinica con los datos cargados.
+    :param ruta: Ruta del archivo a generar.
+    :param tamanio_lote: Cantidad de filas por grupo.
+    :param procesos: Cantidad de procesos que codifican lotes (por defecto, la cantidad de CPUs,
+    limitada a la cantidad de lotes).
+    :return: Diccionario con registros, segundos y registros_por_segundo. El tiempo incluye el
+    arranque de los procesos, que domina en exportaciones chicas.
+    :raises ValueError: Si `tamanio_lote` o `procesos` son menores que 1.
+    """
+    procesos = _procesos_a_usar(clinica, tamanio_lote, procesos)
+    inicio = time.perf_counter()
+    esquema = json.dumps({'columnas': [{'nombre': nombre, 'tipo': tipo} for nombre, tipo in ESQUEMA]}).encode('utf-8')
+    with open(ruta, 'wb') as archivo:
+        archivo.write(MAGIC_COLUMNAR + struct.pack('<I', len(esquema)) + esquema)
+        registros = _exportar(filas_exportacion(clinica), archivo, _codificar_columnar, tamanio_lote, procesos)
+    return _estadisticas(ruta, registros, inicio)
+
+
+def _leer_exacto(archivo, cantidad):
+    datos = archivo.read(cantidad)
+    if len(datos) != cantidad:
+        raise ValueError("Archivo columnar truncado.")
+    return datos
+
+
+def leer_columnar(ruta):
+    """
+    Lee un archivo generado por `exportar_columnar` y devuelve sus grupos de a uno.
+
+    :param ruta: Ruta del archivo columnar.
+    :return: Generador de diccionarios nombre de columna -> lista de valores, uno por grupo.
+    """
+    with open(ruta, 'rb') as archivo:
+        if archivo.read(4) != MAGIC_COLUMNAR:
+            raise ValueError("El archivo no tiene formato columnar.")
+        largo_esquema, = struct.unpack('<I', _leer_exacto(archivo, 4))
+        columnas = json.loads(_leer_exacto(archivo, largo_esquema))['columnas']
+        while True:
+            cabecera = archivo.read(4)
+            if not cabecera:
+                return
+            cantidad, = struct.unpack('<I', cabecera)
+            grupo = {}
+            for columna in columnas:
+                largo, = struct.unpack('<I', _leer_exacto(archivo, 4))
+                datos = _leer_exacto(archivo, largo)
+                if columna['tipo'] in ('int', 'float'):
+                    valores = array('q' if columna['tipo'] == 'int' else 'd')
+                    valores.frombytes(datos)
+                    if sys.byteorder == 'big':
+                        valores.byteswap()
+                    grupo[columna['nombre']] = valores.tolist()
+                else:
+                    offsets = array('I')
+                    offsets.frombytes(datos[:(cantidad + 1) * offsets.itemsize])
+                    if sys.byteorder == 'big':
+                        offsets.byteswap()
+                    texto = datos[(cantidad + 1) * offsets.itemsize:]
+                    grupo[columna['nombre']] = [texto[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(cantidad)]
+            yield grupo
+
+
+def main():
+    """
+    Punto de entrada de línea de comandos: carga los datos de la clínica y los exporta.
+    """
+    from app import generar_configs_json, cargar_configs
+    from clinica import Clinica
+
+    parser = argparse.ArgumentParser(description="Exporta los turnos de la clínica unidos con sus pacientes.")
+    parser.add_argument('formato', choices=['csv', 'columnar'], help="Formato del archivo exportado.")
+    parser.add_argument('--salida', help="Ruta del archivo a generar.")
+    parser.add_argument('--lote', type=int, default=TAMANIO_LOTE, help="Filas por lote.")
+    parser.add_argument('--procesos', type=int, default=None, help="Procesos que codifican lotes.")
+    args = parser.parse_args()
+
+    generar_configs_json()
+    configs = cargar_configs()
+    clinica = Clinica("UTN-Medical Center", configs["especialidades"], configs["obras_sociales"])
+    clinica.cargar_datos()
+
+    try:
+        if args.formato == 'csv':
+            resultado = exportar_csv(clinica, args.salida or 'turnos_export.csv', args.lote, args.procesos)
+        else:
+            resultado = exportar_columnar(clinica, args.salida or 'turnos_export.utnc', args.lote, args.procesos)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"{resultado['registros']} registros exportados a {resultado['ruta']} "
+          f"({resultado['registros_por_segundo']:.0f} registros/seg).")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,410 @@
+# MIT License
+#
+# Copyright (c) 2024 [UTN FRA](https://fra.utn.edu.ar/) All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import argparse
+import datetime
+import io
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
+
+import app
+from clinica import Clinica
+from paciente import Paciente
+from turno import Turno
+
+try:
+    import resource # solo disponible en sistemas tipo Unix
+except ImportError:
+    resource = None
+
+NOMBRES = ["Antonella", "Oscar", "Rosa", "Agustina", "Martina", "Juan", "Lucia", "Pedro", "Sofia", "Tomas"]
+APELLIDOS = ["Palacios", "Faena", "Sabino", "Sanchez", "Perez", "Gomez", "Diaz", "Romero", "Torres", "Alvarez"]
+
+# Tipos que se recorren al medir la memoria de la clínica
+TIPOS_CONTENEDOR = (list, tuple, set, dict)
+TIPOS_ESCALARES = (int, float, str, bool, datetime.date, type(None))
+
+# Formas de ejecutar la simulación: llamando a Clinica o alimentando app.main_app por stdin
+MODOS = ('directo', 'menu')
+
+# Operaciones de Clinica que se cronometran, con el nombre con el que aparecen en el reporte
+OPERACIONES = {
+    'cargar_paciente': 'alta_paciente',
+    'cargar_turno': 'alta_turno',
+    'atender_pacientes': 'atender',
+    'cobrar_atenciones': 'cobrar',
+    'cerrar_caja': 'cerrar_caja'
+}
+
+
+class Metricas:
+    def __init__(self):
+        """
+        Inicializa los acumuladores de latencias (por semana y operación) y las mediciones semanales.
+        """
+        self.semana = 0
+        self.latencias = {} # semana -> {operacion: [segundos, ...]}
+        self.semanas = []
+        self.clinica = None # última Clinica usada; se mantiene viva para medir su memoria
+
+    def registrar(self, operacion, segundos):
+        """
+        Registra la latencia de una operación en la semana simulada actual.
+
+        :param operacion: Nombre de la operación.
+        :param segundos: Duración medida.
+        """
+        self.latencias.setdefault(self.semana, {}).setdefault(operacion, []).append(segundos)
+
+    def percentiles(self, operacion, semana=None):
+        """
+        Calcula p50, p95 y p99 (en milisegundos) de una operación, en una semana o en toda la simulación.
+
+        :param operacion: Nombre de la operación.
+        :param semana: Número de semana (opcional).
+        :return: Diccionario con p50, p95, p99 y cantidad, o None si no hay mediciones.
+        """
+        semanas = [semana] if semana is not None else list(self.latencias)
+        valores = sorted(v for s in semanas for v in self.latencias.get(s, {}).get(operacion, []))
+        if not valores:
+            return None
+
+        def percentil(p):
+            return valores[min(len(valores) - 1, math.ceil(p / 100 * len(valores)) - 1)] * 1000
+
+        return {'p50': percentil(50), 'p95': percentil(95), 'p99': percentil(99), 'cantidad': len(valores)}
+
+    def cerrar_semana(self):
+        """
+        Registra los turnos y la memoria de la última Clinica usada, el pico de memoria del proceso
+        y el tamaño de los archivos persistidos, al terminar una semana simulada. Se mide fuera de
+        las operaciones cronometradas, así no afecta las latencias.
+        """
+        self.semanas.append({
+            'semana': self.semana + 1,
+            'turnos': len(self.clinica.lista_turnos) if self.clinica else 0,
+            'memoria_kb': _memoria_clinica(self.clinica) / 1024,
+            # ru_maxrss está en KB en Linux (en macOS, en bytes)
+            'rss_pico_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+            'archivos_kb': sum(os.path.getsize(f) for f in ('pacientes.json', 'turnos.json') if os.path.exists(f)) / 1024
+        })
+        self.semana += 1
+
+
+def _memoria_clinica(clinica):
+    """
+    Estima los bytes que ocupan los datos de la clínica sumando `sys.getsizeof` de cada objeto
+    alcanzable desde ella (listas, índices, pacientes, turnos y sus atributos), contando cada
+    objeto una sola vez.
+
+    :param clinica: Instancia de Clinica (o None).
+    :return: Cantidad de bytes.
+    """
+    if clinica is None:
+        return 0
+    vistos = set()
+    pendientes = [clinica]
+    total = 0
+    while pendientes:
+        objeto = pendientes.pop()
+        if id(objeto) in vistos or not isinstance(objeto, (Clinica, Paciente, Turno) + TIPOS_CONTENEDOR + TIPOS_ESCALARES):
+            continue
+        vistos.add(id(objeto))
+        total += sys.getsizeof(objeto)
+        if isinstance(objeto, dict):
+            pendientes.extend(objeto.keys())
+            pendientes.extend(objeto.values())
+        elif isinstance(objeto, TIPOS_CONTENEDOR):
+            pendientes.extend(objeto)
+        elif isinstance(objeto, (Clinica, Paciente, Turno)):
+            pendientes.append(vars(objeto))
+    return total
+
+
+@contextmanager
+def _instrumentar(metricas):
+    """
+    Reemplaza temporalmente los métodos de `OPERACIONES` en Clinica por versiones cronometradas,
+    de modo que se miden igual cuando se los llama directamente o desde `app.main_app`. También
+    guardan la instancia en `metricas.clinica`, para medirla después de que `main_app` termina.
+    """
+    originales = {metodo: getattr(Clinica, metodo) for metodo in OPERACIONES}
+
+    def cronometrar(metodo, operacion):
+        def envoltura(self, *args, **kwargs):
+            metricas.clinica = self
+            inicio = time.perf_counter()
+            try:
+                return metodo(self, *args, **kwargs)
+            finally:
+                metricas.registrar(operacion, time.perf_counter() - inicio)
+        return envoltura
+
+    for metodo, operacion in OPERACIONES.items():
+        setattr(Clinica, metodo, cronometrar(originales[metodo], operacion))
+    try:
+        yield
+    finally:
+        for metodo, funcion in originales.items():
+            setattr(Clinica, metodo, funcion)
+
+
+@contextmanager
+def _directorio_trabajo(directorio):
+    """
+    Ejecuta la simulación dentro de `directorio` (o de uno temporal), ya que la clínica lee y
+    escribe sus archivos JSON en el directorio actual.
+    """
+    anterior = os.getcwd()
+    temporal = None if directorio else tempfile.TemporaryDirectory()
+    destino = directorio or temporal.name
+    os.makedirs(destino, exist_ok=True)
+    os.chdir(destino)
+    try:
+        yield destino
+    finally:
+        os.chdir(anterior)
+        if temporal:
+            temporal.cleanup()
+
+
+def _llegadas(rng, tasa):
+    """
+    Devuelve cuántas llegadas ocurren en un día para un proceso de Poisson con la tasa diaria dada.
+    """
+    if tasa <= 0:
+        return 0
+    cantidad, tiempo = 0, rng.expovariate(tasa)
+    while tiempo < 1:
+        cantidad += 1
+        tiempo += rng.expovariate(tasa)
+    return cantidad
+
+
+class GeneradorEventos:
+    def __init__(self, clinica, pacientes_por_dia, turnos_por_dia, semilla=None):
+        """
+        Genera las operaciones de cada día simulado: altas y turnos llegan con las tasas dadas,
+        mezclados con atenciones, y el día termina atendiendo a todos, cobrando y cerrando caja.
+        Parte del estado de `clinica` (ya cargada), para que los IDs de los pacientes nuevos y sus
+        DNIs coincidan con los que asignará la clínica y no choquen con los existentes.
+
+        :param clinica: Clinica con los datos persistidos ya cargados.
+        :param pacientes_por_dia: Tasa media de altas de pacientes por día.
+        :param turnos_por_dia: Tasa media de turnos solicitados por día.
+        :param semilla: Semilla del generador aleatorio (opcional).
+        """
+        self.pacientes_por_dia = pacientes_por_dia
+        self.turnos_por_dia = turnos_por_dia
+        self.rng = random.Random(semilla)
+        self.ids_pacientes = [p.id for p in clinica.lista_pacientes]
+        self.proximo_id = clinica.next_patient_id
+        self.dnis_usados = set(clinica.dnis_registrados)
+        self.proximo_dni = 20000000
+        self.especialidades = list(clinica.especialidades)
+        self.pendientes = sum(1 for t in clinica.lista_turnos if t.estado in ('Activo', 'Finalizado'))
+
+    def _alta(self):
+        edad = self.rng.randint(18, 90)
+        obra_social = "PAMI" if edad >= 60 else self.rng.choice(["Swiss Medical", "Apres", "Particular"])
+        self.proximo_dni += 1
+        while self.proximo_dni in self.dnis_usados:
+            self.proximo_dni += 1
+        self.dnis_usados.add(self.proximo_dni)
+        self.ids_pacientes.append(self.proximo_id)
+        self.proximo_id += 1
+        return ('alta', self.rng.choice(NOMBRES), self.rng.choice(APELLIDOS), self.proximo_dni, edad, obra_social)
+
+    def dia(self):
+        """
+        Genera los eventos de un día.
+
+        :return: Lista de tuplas cuyo primer elemento es el tipo de evento.
+        """
+        llegadas = ['alta'] * _llegadas(self.rng, self.pacientes_por_dia) + ['turno'] * _llegadas(self.rng, self.turnos_por_dia)
+        self.rng.shuffle(llegadas)
+        eventos = []
+        for llegada in llegadas:
+            if llegada == 'alta' or not self.ids_pacientes:
+                eventos.append(self._alta())
+            else:
+                eventos.append(('turno', self.rng.choice(self.ids_pacientes), self.rng.choice(self.especialidades)))
+            if self.rng.random() < 0.25:
+                eventos.append(('atender',))
+        # Turnos del día más los que quedaron pendientes en los datos cargados
+        turnos = sum(1 for evento in eventos if evento[0] == 'turno') + self.pendientes
+        self.pendientes = 0
+        eventos += [('atender',)] * (turnos // 2 + 1)
+        eventos += [('cobrar',), ('cerrar',)]
+        return eventos
+
+
+def _ejecutar_directo(clinica, eventos):
+    """
+    Ejecuta los eventos de un día llamando directamente a los métodos de la clínica.
+    """
+    for evento in eventos:
+        match evento[0]:
+            case 'alta':
+                clinica.cargar_paciente(*evento[1:])
+            case 'turno':
+                clinica.cargar_turno(*evento[1:])
+            case 'atender':
+                clinica.atender_pacientes()
+            case 'cobrar':
+                clinica.cobrar_atenciones()
+            case 'cerrar':
+                clinica.cerrar_caja()
+
+
+def _entrada_menu(eventos):
+    """
+    Traduce los eventos de un día a las respuestas que espera `app.main_app` por stdin, terminando con Salir.
+    """
+    lineas = []
+    for evento in eventos:
+        match evento[0]:
+            case 'alta':
+                lineas += ['1', *map(str, evento[1:])]
+            case 'turno':
+                lineas += ['2', str(evento[1]), evento[2]]
+            case 'atender':
+                lineas.append('5')
+            case 'cobrar':
+                lineas.append('6')
+            case 'cerrar':
+                lineas.append('7')
+    lineas.append(str(app.OPCION_SALIR))
+    return '\n'.join(lineas) + '\n'
+
+
+def simular(semanas=4, pacientes_por_dia=20, turnos_por_dia=30, modo='directo', semilla=None, directorio=None):
+    """
+    Simula `semanas` semanas de uso de la clínica y mide latencias, memoria y tamaño de los archivos.
+
+    En modo 'directo' una misma instancia de Clinica recibe todas las operaciones. En modo 'menu' cada
+    día es una ejecución de `app.main_app` alimentada por stdin, que recarga los archivos persistidos
+    el día anterior; además de cada operación se mide la sesión completa ('sesion_menu').
+
+    :param semanas: Cantidad de semanas simuladas (7 días cada una).
+    :param pacientes_por_dia: Tasa media de altas por día.
+    :param turnos_por_dia: Tasa media de turnos por día.
+    :param modo: 'directo' o 'menu'.
+    :param semilla: Semilla del generador aleatorio (opcional).
+    :param directorio: Directorio donde persistir los archivos (por defecto, uno temporal).
+    :return: Instancia de Metricas con los resultados.
+    :raises ValueError: Si `modo` no es 'directo' ni 'menu'.
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo de simulación desconocido: {modo!r} (se esperaba uno de {', '.join(MODOS)}).")
+    metricas = Metricas()
+    with _directorio_trabajo(directorio), _instrumentar(metricas), open(os.devnull, 'w') as salida:
+        with redirect_stdout(salida):
+            app.generar_configs_json()
+        configs = app.cargar_configs()
+        # Se parte de los datos ya persistidos en el directorio, para no pisarlos con IDs repetidos
+        clinica = Clinica("UTN-Medical Center", configs["especialidades"], configs["obras_sociales"])
+        clinica.cargar_datos()
+        generador = GeneradorEventos(clinica, pacientes_por_dia, turnos_por_dia, semilla)
+        if modo == 'menu':
+            clinica = None # cada día main_app carga su propia Clinica
+        for semana in range(semanas):
+            for dia in range(7):
+                eventos = generador.dia()
+                with redirect_stdout(salida):
+                    if modo == 'menu':
+                        inicio = time.perf_counter()
+                        _ejecutar_menu(eventos, semana * 7 + dia + 1)
+                        metricas.registrar('sesion_menu', time.perf_counter() - inicio)
+                    else:
+                        _ejecutar_directo(clinica, eventos)
+            metricas.cerrar_semana()
+    return metricas
+
+
+def _ejecutar_menu(eventos, dia):
+    """
+    Ejecuta los eventos de un día como una sesión de `app.main_app` alimentada por stdin.
+
+    :raises RuntimeError: Si el guion se desincroniza del menú (por ejemplo, porque un dato fue
+    rechazado y se volvió a pedir), en lugar de fallar con un EOFError en medio de la sesión.
+    """
+    entrada = io.StringIO(_entrada_menu(eventos))
+    stdin_original, sys.stdin = sys.stdin, entrada
+    try:
+        app.main_app()
+    except EOFError:
+        raise RuntimeError(f"Día {dia}: el guion de stdin se desincronizó del menú y se agotó antes de salir "
+                           f"(algún dato fue rechazado y se volvió a pedir).") from None
+    finally:
+        sys.stdin = stdin_original
+    if entrada.read().strip():
+        raise RuntimeError(f"Día {dia}: el menú terminó sin consumir todo el guion de stdin.")
+
+
+def mostrar_reporte(metricas):
+    """
+    Muestra los percentiles de latencia por operación y la evolución semanal de turnos, memoria,
+    archivos y p95, para detectar pérdidas de memoria o demoras que crecen más que los datos.
+
+    :param metricas: Resultado de `simular`.
+    """
+    operaciones = list(OPERACIONES.values()) + ['sesion_menu']
+    print("Latencias (ms):")
+    for operacion in operaciones:
+        resultado = metricas.percentiles(operacion)
+        if resultado:
+            print(f"  {operacion:<14} p50={resultado['p50']:.3f} p95={resultado['p95']:.3f} "
+                  f"p99={resultado['p99']:.3f} n={resultado['cantidad']}")
+    print("Evolución semanal:")
+    for indice, semana in enumerate(metricas.semanas):
+        p95 = ", ".join(f"{operacion}={resultado['p95']:.3f}" for operacion in operaciones
+                        if (resultado := metricas.percentiles(operacion, indice)))
+        rss = f", RSS pico={semana['rss_pico_kb']} KB" if semana['rss_pico_kb'] is not None else ""
+        print(f"  Semana {semana['semana']}: turnos={semana['turnos']}, memoria de la clínica={semana['memoria_kb']:.0f} KB{rss}, "
+              f"archivos={semana['archivos_kb']:.0f} KB, p95 ms: {p95}")
+
+
+def main():
+    """
+    Punto de entrada de línea de comandos de la simulación.
+    """
+    parser = argparse.ArgumentParser(description="Simula semanas de uso de la clínica y mide su rendimiento.")
+    parser.add_argument('--modo', choices=MODOS, default='directo', help="Cómo se ejecutan las operaciones.")
+    parser.add_argument('--semanas', type=int, default=4, help="Semanas simuladas.")
+    parser.add_argument('--pacientes-por-dia', type=float, default=20, help="Tasa media de altas por día.")
+    parser.add_argument('--turnos-por-dia', type=float, default=30, help="Tasa media de turnos por día.")
+    parser.add_argument('--semilla', type=int, default=None, help="Semilla del generador aleatorio.")
+    parser.add_argument('--directorio', default=None, help="Directorio donde persistir los archivos (por defecto, uno temporal).")
+    args = parser.parse_args()
+
+    metricas = simular(args.semanas, args.pacientes_por_dia, args.turnos_por_dia, args.modo, args.semilla, args.directorio)
+    mostrar_reporte(metricas)
+
+
+if __name__ == '__main__':
+    main()
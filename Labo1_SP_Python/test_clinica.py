@@ -0,0 +1,111 @@
+# MIT License
+#
+# Copyright (c) 2024 [UTN FRA](https://fra.utn.edu.ar/) All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import date
+
+from clinica import Clinica
+
+PACIENTES = [
+    {"id": 1, "nombre": "Antonella", "apellido": "Palacios", "dni": 40587458, "edad": 28,
+     "fecha_registro": "2024-07-07", "obra_social": "Apres"},
+    {"id": 2, "nombre": "Oscar", "apellido": "Faena", "dni": 8400258, "edad": 74,
+     "fecha_registro": "2024-07-07", "obra_social": "PAMI"}
+]
+TURNOS = [
+    {"id_paciente": 1, "especialidad": "Odontologia", "monto": 2880.0, "fecha": "2024-07-07", "estado": "Pagado"},
+    {"id_paciente": 2, "especialidad": "Psicologia", "monto": 1600.0, "fecha": "2024-07-08", "estado": "Pagado"},
+    {"id_paciente": 1, "especialidad": "Psicologia", "monto": 2880.0, "fecha": "2024-07-10", "estado": "Finalizado"}
+]
+
+
+class TestHistorialPaciente(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+        anterior = os.getcwd()
+        os.chdir(self.directorio.name)
+        self.addCleanup(os.chdir, anterior)
+        with open('pacientes.json', 'w') as file:
+            json.dump(PACIENTES, file)
+        with open('turnos.json', 'w') as file:
+            json.dump(TURNOS, file)
+        self.clinica = Clinica("UTN-Medical Center", {"Odontologia": 4000, "Psicologia": 4000}, {})
+        self.clinica.cargar_datos()
+
+    def cargar_turno(self, id_paciente, especialidad):
+        with redirect_stdout(io.StringIO()) as salida:
+            self.clinica.cargar_turno(id_paciente, especialidad)
+        return salida.getvalue()
+
+    def test_indice_despues_de_cargar_datos(self):
+        self.assertEqual([t.fecha for t in self.clinica.historial_paciente(1)], [date(2024, 7, 7), date(2024, 7, 10)])
+        self.assertEqual(len(self.clinica.historial_paciente(2)), 1)
+        self.assertEqual(self.clinica.historial_paciente(99), [])
+
+    def test_indice_despues_de_cargar_turno(self):
+        self.cargar_turno(2, 'Odontologia')
+        historial = self.clinica.historial_paciente(2)
+        self.assertEqual(len(historial), 2)
+        self.assertIs(historial[-1], self.clinica.lista_turnos[-1])
+        self.assertTrue(self.clinica.tiene_turno_activo(2))
+
+    def test_rechaza_segundo_turno_activo(self):
+        self.cargar_turno(2, 'Odontologia')
+        salida = self.cargar_turno(2, 'Psicologia')
+        self.assertIn("ya tiene un turno activo", salida)
+        self.assertEqual(len(self.clinica.historial_paciente(2)), 2)
+
+    def test_acepta_turno_despues_de_atendido(self):
+        self.cargar_turno(2, 'Odontologia')
+        self.clinica.historial_paciente(2)[-1].estado = 'Finalizado'
+        self.cargar_turno(2, 'Psicologia')
+        self.assertEqual(len(self.clinica.historial_paciente(2)), 3)
+        self.clinica.historial_paciente(2)[-1].estado = 'Pagado'
+        self.cargar_turno(2, 'Odontologia')
+        self.assertEqual(len(self.clinica.historial_paciente(2)), 4)
+
+    def test_ultima_visita_ignora_turnos_activos(self):
+        self.cargar_turno(2, 'Odontologia')
+        self.assertEqual(self.clinica.ultima_visita(2), date(2024, 7, 8))
+        self.assertEqual(self.clinica.ultima_visita(1), date(2024, 7, 10))
+        self.assertIsNone(self.clinica.ultima_visita(99))
+
+    def test_saldo_pendiente(self):
+        self.assertEqual(self.clinica.saldo_pendiente(1), 2880.0)
+        self.assertEqual(self.clinica.saldo_pendiente(2), 0)
+        self.cargar_turno(2, 'Odontologia')
+        self.assertEqual(self.clinica.saldo_pendiente(2), 0)
+
+    def test_historial_de_paciente_inexistente(self):
+        with redirect_stdout(io.StringIO()) as salida:
+            self.clinica.mostrar_historial_paciente(99)
+        self.assertEqual(salida.getvalue().strip(), "Error: Paciente no encontrado.")
+
+
+if __name__ == '__main__':
+    unittest.main()
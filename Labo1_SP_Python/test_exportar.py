@@ -0,0 +1,88 @@
+# MIT License
+#
+# Copyright (c) 2024 [UTN FRA](https://fra.utn.edu.ar/) All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import csv
+import os
+import tempfile
+import unittest
+from datetime import date
+
+from clinica import Clinica
+from exportar import ESQUEMA, exportar_csv, exportar_columnar, filas_exportacion, leer_columnar
+from paciente import Paciente
+from turno import Turno
+
+
+def crear_clinica(cantidad_turnos):
+    """
+    Arma una clínica en memoria con dos pacientes y `cantidad_turnos` turnos, uno de ellos sin paciente.
+    """
+    clinica = Clinica("UTN-Medical Center", {"Odontologia": 4000}, {})
+    clinica.lista_pacientes = [
+        Paciente(1, "Antonella", "Palacios", 40587458, 28, date(2024, 7, 7), "Apres"),
+        Paciente(2, "José", "Nuñez", 8400258, 74, date(2024, 7, 7), "PAMI")
+    ]
+    clinica.lista_turnos = [Turno(i % 3 + 1, "Odontologia", 1000.0 + i, date(2024, 7, 8), "Pagado")
+                            for i in range(cantidad_turnos)]
+    return clinica
+
+
+class TestExportar(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+        self.clinica = crear_clinica(25)
+        self.esperado = list(filas_exportacion(self.clinica))
+
+    def ruta(self, nombre):
+        return os.path.join(self.directorio.name, nombre)
+
+    def test_columnar_ida_y_vuelta(self):
+        for procesos in (1, 2):
+            resultado = exportar_columnar(self.clinica, self.ruta('t.utnc'), tamanio_lote=10, procesos=procesos)
+            self.assertEqual(resultado['registros'], 25)
+            grupos = list(leer_columnar(self.ruta('t.utnc')))
+            self.assertEqual([len(g['id_paciente']) for g in grupos], [10, 10, 5])
+            filas = [fila for g in grupos for fila in zip(*(g[nombre] for nombre, _ in ESQUEMA))]
+            self.assertEqual(filas, self.esperado)
+
+    def test_csv_ida_y_vuelta(self):
+        for procesos in (1, 2):
+            resultado = exportar_csv(self.clinica, self.ruta('t.csv'), tamanio_lote=10, procesos=procesos)
+            self.assertEqual(resultado['registros'], 25)
+            with open(self.ruta('t.csv'), newline='', encoding='utf-8') as archivo:
+                filas = list(csv.reader(archivo))
+            self.assertEqual(filas[0], [nombre for nombre, _ in ESQUEMA])
+            self.assertEqual(filas[1:], [[str(valor) for valor in fila] for fila in self.esperado])
+
+    def test_parametros_invalidos(self):
+        for exportar in (exportar_csv, exportar_columnar):
+            with self.assertRaises(ValueError):
+                exportar(self.clinica, self.ruta('t'), tamanio_lote=0)
+            with self.assertRaises(ValueError):
+                exportar(self.clinica, self.ruta('t'), tamanio_lote=-5)
+            with self.assertRaises(ValueError):
+                exportar(self.clinica, self.ruta('t'), procesos=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# MIT License
+#
+# Copyright (c) 2024 [UTN FRA](https://fra.utn.edu.ar/) All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import tempfile
+import unittest
+
+from simulacion import simular
+
+
+class TestSimulacion(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+
+    def test_modos(self):
+        for modo in ('directo', 'menu'):
+            with self.subTest(modo=modo):
+                metricas = simular(semanas=1, pacientes_por_dia=5, turnos_por_dia=8, modo=modo, semilla=7,
+                                   directorio=f"{self.directorio.name}/{modo}")
+                self.assertEqual(len(metricas.semanas), 1)
+                self.assertGreater(metricas.semanas[0]['turnos'], 0)
+                self.assertGreater(metricas.semanas[0]['memoria_kb'], 0)
+                self.assertIsNotNone(metricas.percentiles('alta_turno'))
+
+    def test_menu_repetido_sobre_el_mismo_directorio(self):
+        primera = simular(semanas=1, pacientes_por_dia=5, turnos_por_dia=8, modo='menu', semilla=7,
+                          directorio=self.directorio.name)
+        segunda = simular(semanas=1, pacientes_por_dia=5, turnos_por_dia=8, modo='menu', semilla=7,
+                          directorio=self.directorio.name)
+        self.assertGreater(segunda.semanas[0]['turnos'], primera.semanas[0]['turnos'])
+
+    def test_modo_desconocido(self):
+        with self.assertRaises(ValueError):
+            simular(semanas=1, modo='directa', directorio=self.directorio.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# MIT License
+#
+# Copyright (c) 2024 [UTN FRA](https://fra.utn.edu.ar/) All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import unittest
+
+from clinica import Clinica
+from validaciones import (PIPELINE_PACIENTE, ERROR_EDAD, ERROR_DNI_INVALIDO, ERROR_DNI_DUPLICADO,
+                          ERROR_NOMBRE, ERROR_APELLIDO, ERROR_OBRA_SOCIAL)
+
+
+def paciente(**cambios):
+    registro = {'nombre': 'Ana', 'apellido': 'Gil', 'dni': 30111222, 'edad': 30, 'obra_social': 'Apres'}
+    registro.update(cambios)
+    return registro
+
+
+class TestPipelinePaciente(unittest.TestCase):
+    def test_registro_valido(self):
+        self.assertEqual(PIPELINE_PACIENTE.validar(paciente(), {1, 2}), [])
+
+    def test_edad_invalida_no_arrastra_obra_social(self):
+        self.assertEqual(PIPELINE_PACIENTE.validar(paciente(edad='treinta')), [ERROR_EDAD])
+
+    def test_registro_que_no_es_diccionario(self):
+        self.assertEqual(PIPELINE_PACIENTE.validar(None),
+                         [ERROR_NOMBRE, ERROR_APELLIDO, ERROR_EDAD, ERROR_DNI_INVALIDO])
+
+    def test_lote_detecta_duplicados_sin_modificar_el_conjunto(self):
+        registrados = {30111222}
+        errores = PIPELINE_PACIENTE.validar_lote(
+            [paciente(), paciente(dni=5), paciente(dni=5), None, paciente(dni=6, edad=70)], registrados)
+        self.assertEqual(errores[0], [ERROR_DNI_DUPLICADO])
+        self.assertEqual(errores[2], [ERROR_DNI_DUPLICADO])
+        self.assertIn(ERROR_DNI_INVALIDO, errores[3])
+        self.assertEqual(errores[4], [ERROR_OBRA_SOCIAL])
+        self.assertNotIn(1, errores)
+        self.assertEqual(registrados, {30111222})
+
+
+class TestClinica(unittest.TestCase):
+    def setUp(self):
+        self.clinica = Clinica("UTN-Medical Center", {"Odontologia": 4000}, {})
+
+    def test_cargar_pacientes_lote(self):
+        errores = self.clinica.cargar_pacientes_lote([paciente(), paciente(), None])
+        self.assertEqual(sorted(errores), [1, 2])
+        self.assertEqual(len(self.clinica.lista_pacientes), 1)
+        self.assertIn(30111222, self.clinica.dnis_registrados)
+
+    def test_turno_usa_especialidades_configuradas(self):
+        self.clinica.cargar_paciente('Ana', 'Gil', 30111222, 30, 'Apres')
+        self.clinica.especialidades['Cardiologia'] = 5000
+        self.clinica.cargar_turno(1, 'Cardiologia')
+        self.clinica.cargar_turno(1, 'Psicologia')
+        self.assertEqual([t.especialidad for t in self.clinica.lista_turnos], ['Cardiologia'])
+
+
+if __name__ == '__main__':
+    unittest.main()
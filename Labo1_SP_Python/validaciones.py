@@ -64,18 +64,8 @@ def solicitar_obra_social(edad):
     :param edad: Edad del paciente.
     :return: La obra social ingresada por el usuario.
     """
-    while True:
-        obra_social = input("Ingrese obra social (Swiss Medical, Apres, PAMI, Particular): ")
-        if edad >= 60:
-            if obra_social != "PAMI":
-                print("Para pacientes mayores de 60, solo PAMI está disponible")
-            else:
-                return obra_social
-        else:
-            if obra_social not in ["Swiss Medical", "Apres", "Particular"]:
-                print("Obra social inválida")
-            else:
-                return obra_social
+    return solicitar_validado("Ingrese obra social (Swiss Medical, Apres, PAMI, Particular): ", 'obra_social',
+                              PIPELINE_PACIENTE, registro={'edad': edad})
 
 def validar_nombre_apellido(nombre):
     """
@@ -110,12 +100,193 @@ def validar_obra_social(obra_social, edad):
         return False
     return obra_social in obras_validas # verifico q la obra este en la lista de obras
 
-def validar_especialidad(especialidad):
+def validar_especialidad(especialidad, especialidades=None):
     """
     Valida que la especialidad médica sea una de las permitidas.
 
     :param especialidad: La especialidad médica a validar.
+    :param especialidades: Especialidades que ofrece la clínica (por defecto, las cuatro iniciales).
     :return: True si la especialidad es válida, False en caso contrario.
     """
-    return especialidad in ["Medico Clinico", "Odontologia", "Psicologia", "Traumatologia"]
-    #verifico que la esp este en la list de espe validas
\ No newline at end of file
+    if especialidades is None:
+        especialidades = ["Medico Clinico", "Odontologia", "Psicologia", "Traumatologia"]
+    return especialidad in especialidades
+    #verifico que la esp este en la list de espe validas
+
+# Códigos de error que devuelven los pipelines de validación
+ERROR_NOMBRE = 'NOMBRE_INVALIDO'
+ERROR_APELLIDO = 'APELLIDO_INVALIDO'
+ERROR_EDAD = 'EDAD_INVALIDA'
+ERROR_OBRA_SOCIAL = 'OBRA_SOCIAL_INVALIDA'
+ERROR_ESPECIALIDAD = 'ESPECIALIDAD_INVALIDA'
+ERROR_DNI_INVALIDO = 'DNI_INVALIDO'
+ERROR_DNI_DUPLICADO = 'DNI_DUPLICADO'
+
+MENSAJES_ERROR = {
+    ERROR_NOMBRE: "Nombre inválido (solo letras, hasta 30 caracteres).",
+    ERROR_APELLIDO: "Apellido inválido (solo letras, hasta 30 caracteres).",
+    ERROR_EDAD: "Edad inválida (debe estar entre 18 y 90).",
+    ERROR_OBRA_SOCIAL: "Obra social inválida (para pacientes de 60 o más, solo PAMI).",
+    ERROR_ESPECIALIDAD: "Especialidad inválida.",
+    ERROR_DNI_INVALIDO: "DNI inválido.",
+    ERROR_DNI_DUPLICADO: "Ya existe un paciente con ese DNI."
+}
+
+
+class Regla:
+    def __init__(self, codigo, campos, validador):
+        """
+        Inicializa una regla de validación sobre uno o más campos de un registro.
+
+        :param codigo: Código de error que se informa si la regla no se cumple.
+        :param campos: Tupla con los nombres de los campos que usa la regla. El primero es el campo
+        validado; los demás son datos de los que depende (por ejemplo, la edad para la obra social).
+        :param validador: Función que recibe los valores de `campos` (en ese orden) y devuelve True si son válidos.
+        """
+        self.codigo = codigo
+        self.campos = campos
+        self.validador = validador
+
+    def cumple(self, registro):
+        """
+        Aplica la regla al registro. Un registro que no es un diccionario, o un campo faltante o de
+        tipo incorrecto, cuenta como inválido.
+
+        :param registro: Diccionario con los datos a validar.
+        :return: True si el registro cumple la regla, False en caso contrario.
+        """
+        try:
+            return bool(self.validador(*(registro[campo] for campo in self.campos)))
+        except (KeyError, TypeError, AttributeError):
+            return False
+
+
+class PipelineValidacion:
+    def __init__(self, reglas, validar_dni=False):
+        """
+        Inicializa un pipeline con un conjunto fijo de reglas.
+
+        :param reglas: Reglas que se aplican a cada registro, en orden.
+        :param validar_dni: Si es True, también se controla que el DNI sea un entero y no esté repetido.
+        """
+        self.reglas = tuple(reglas)
+        self.validar_dni = validar_dni
+
+    def _reglas_incumplidas(self, registro):
+        """
+        Aplica las reglas en orden. Una regla se saltea si alguno de los campos de los que depende
+        ya resultó inválido, para no informar errores que son consecuencia de otro.
+        """
+        incumplidas = []
+        campos_invalidos = set()
+        for regla in self.reglas:
+            if campos_invalidos.intersection(regla.campos[1:]):
+                continue
+            if not regla.cumple(registro):
+                incumplidas.append(regla)
+                campos_invalidos.add(regla.campos[0])
+        return incumplidas
+
+    def _errores_dni(self, registro, dnis_registrados, dnis_lote=()):
+        """
+        Controla que el DNI del registro sea un entero positivo que no esté en `dnis_registrados`
+        ni en `dnis_lote`. Un registro que no es un diccionario cuenta como DNI inválido, igual que en `Regla.cumple`.
+        """
+        try:
+            dni = registro['dni']
+        except (KeyError, TypeError):
+            return [ERROR_DNI_INVALIDO]
+        if not isinstance(dni, int) or isinstance(dni, bool) or dni <= 0:
+            return [ERROR_DNI_INVALIDO]
+        if (dnis_registrados is not None and dni in dnis_registrados) or dni in dnis_lote:
+            return [ERROR_DNI_DUPLICADO]
+        return []
+
+    def validar_campo(self, registro, campo, dnis_registrados=None):
+        """
+        Devuelve solo los errores del campo dado (las reglas cuyo primer campo es `campo`).
+
+        :param registro: Diccionario con los datos a validar.
+        :param campo: Nombre del campo.
+        :param dnis_registrados: Conjunto de DNIs ya usados (opcional), si el campo es el DNI.
+        :return: Lista con los códigos de error (vacía si el campo es válido).
+        """
+        errores = [regla.codigo for regla in self._reglas_incumplidas(registro) if regla.campos[0] == campo]
+        if campo == 'dni' and self.validar_dni:
+            errores += self._errores_dni(registro, dnis_registrados)
+        return errores
+
+    def validar(self, registro, dnis_registrados=None):
+        """
+        Aplica todas las reglas al registro, sin cortar en el primer error.
+
+        :param registro: Diccionario con los datos a validar.
+        :param dnis_registrados: Conjunto de DNIs ya usados (opcional), para controlar que no se repita.
+        :return: Lista con los códigos de error (vacía si el registro es válido).
+        """
+        errores = [regla.codigo for regla in self._reglas_incumplidas(registro)]
+        if self.validar_dni:
+            errores += self._errores_dni(registro, dnis_registrados)
+        return errores
+
+    def validar_lote(self, registros, dnis_registrados=None):
+        """
+        Valida una lista de registros en una sola pasada. Los DNIs de los registros válidos se
+        guardan en un conjunto propio del lote, de modo que también se detectan repetidos dentro
+        del lote sin copiar `dnis_registrados`.
+
+        :param registros: Lista de diccionarios a validar.
+        :param dnis_registrados: Conjunto de DNIs ya usados (opcional). No se modifica.
+        :return: Diccionario índice del registro -> lista de códigos de error, solo para los registros inválidos.
+        """
+        vistos = set()
+        errores_por_registro = {}
+        for indice, registro in enumerate(registros):
+            errores = [regla.codigo for regla in self._reglas_incumplidas(registro)]
+            if self.validar_dni:
+                errores += self._errores_dni(registro, dnis_registrados, vistos)
+            if errores:
+                errores_por_registro[indice] = errores
+            elif self.validar_dni:
+                vistos.add(registro['dni'])
+        return errores_por_registro
+
+
+PIPELINE_PACIENTE = PipelineValidacion([
+    Regla(ERROR_NOMBRE, ('nombre',), validar_nombre_apellido),
+    Regla(ERROR_APELLIDO, ('apellido',), validar_nombre_apellido),
+    Regla(ERROR_EDAD, ('edad',), validar_edad),
+    Regla(ERROR_OBRA_SOCIAL, ('obra_social', 'edad'), validar_obra_social)
+], validar_dni=True)
+
+# El registro del turno lleva, además de la especialidad, las especialidades configuradas en la clínica
+PIPELINE_TURNO = PipelineValidacion([
+    Regla(ERROR_ESPECIALIDAD, ('especialidad', 'especialidades'), validar_especialidad)
+])
+
+
+def solicitar_validado(mensaje, campo, pipeline, registro=None, conversor=str, dnis_registrados=None):
+    """
+    Solicita al usuario un valor y lo vuelve a pedir hasta que cumpla las reglas del pipeline
+    para ese campo, mostrando el mensaje de cada error.
+
+    :param mensaje: Mensaje que se muestra al usuario.
+    :param campo: Nombre del campo que se está pidiendo.
+    :param pipeline: Pipeline cuyas reglas se aplican.
+    :param registro: Datos ya ingresados que las reglas pueden necesitar (por ejemplo, la edad).
+    :param conversor: Función que convierte el texto ingresado (por ejemplo, int).
+    :param dnis_registrados: Conjunto de DNIs ya usados, si el campo es el DNI.
+    :return: El valor ingresado y convertido.
+    """
+    while True:
+        try:
+            valor = conversor(input(mensaje))
+        except ValueError:
+            print("Por favor, ingrese un valor válido")
+            continue
+        candidato = dict(registro or {}, **{campo: valor})
+        errores = pipeline.validar_campo(candidato, campo, dnis_registrados)
+        if not errores:
+            return valor
+        for codigo in errores:
+            print(MENSAJES_ERROR[codigo])